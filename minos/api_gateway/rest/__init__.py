@@ -6,7 +6,9 @@ from .config import (
 from .exceptions import (
     ApiGatewayConfigException,
     ApiGatewayException,
+    CircuitOpenException,
     NoTokenException,
+    UnavailableServiceException,
 )
 from .launchers import (
     EntrypointLauncher,
@@ -0,0 +1,48 @@
+from time import (
+    monotonic,
+)
+from typing import (
+    Optional,
+)
+
+
+class CircuitBreaker:
+    """Circuit Breaker class.
+
+    The circuit opens after ``failure_threshold`` consecutive failures, so that the calls fail fast during the next
+    ``reset_timeout`` seconds. Once that time has passed, the calls are allowed again: the first success closes the
+    circuit and a new failure opens it again.
+    """
+
+    __slots__ = "failure_threshold", "reset_timeout", "_failures", "_opened_at"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the calls must fail fast.
+
+        :return: ``True`` if the circuit is open or ``False`` otherwise.
+        """
+        return self._opened_at is not None and monotonic() - self._opened_at < self.reset_timeout
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit.
+
+        :return: This method does not return anything.
+        """
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the threshold is reached.
+
+        :return: This method does not return anything.
+        """
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = monotonic()
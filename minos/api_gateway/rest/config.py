@@ -23,7 +23,7 @@ from .exceptions import (
 )
 
 REST = collections.namedtuple("Rest", "host port cors auth admin")
-DISCOVERY = collections.namedtuple("Discovery", "host port")
+DISCOVERY = collections.namedtuple("Discovery", "host port cache_ttl")
 CORS = collections.namedtuple("Cors", "enabled")
 AUTH_SERVICE = collections.namedtuple("AuthService", "name")
 REST_ADMIN = collections.namedtuple("RestAdmin", "username password")
@@ -45,6 +45,7 @@ _ENVIRONMENT_MAPPER = {
     "database.port": "API_GATEWAY_DATABASE_PORT",
     "discovery.host": "API_GATEWAY_DISCOVERY_HOST",
     "discovery.port": "API_GATEWAY_DISCOVERY_PORT",
+    "discovery.cache_ttl": "API_GATEWAY_DISCOVERY_CACHE_TTL",
 }
 
 _PARAMETERIZED_MAPPER = {
@@ -62,8 +63,11 @@ _PARAMETERIZED_MAPPER = {
     "database.port": "api_gateway_database_port",
     "discovery.host": "api_gateway_discovery_host",
     "discovery.port": "api_gateway_discovery_port",
+    "discovery.cache_ttl": "api_gateway_discovery_cache_ttl",
 }
 
+_DEFAULT_DISCOVERY_CACHE_TTL = 30.0
+
 
 class ApiGatewayConfig(abc.ABC):
     """Api Gateway config class."""
@@ -187,4 +191,15 @@ class ApiGatewayConfig(abc.ABC):
 
         :return: A ``REST`` NamedTuple instance.
         """
-        return DISCOVERY(host=self._get("discovery.host"), port=int(self._get("discovery.port")))
+        return DISCOVERY(
+            host=self._get("discovery.host"),
+            port=int(self._get("discovery.port")),
+            cache_ttl=self._discovery_cache_ttl,
+        )
+
+    @property
+    def _discovery_cache_ttl(self) -> float:
+        try:
+            return float(self._get("discovery.cache_ttl"))
+        except KeyError:
+            return _DEFAULT_DISCOVERY_CACHE_TTL
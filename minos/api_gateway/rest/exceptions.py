@@ -8,3 +8,11 @@ class NoTokenException(ApiGatewayException):
 
 class ApiGatewayConfigException(ApiGatewayException):
     """Base config exception."""
+
+
+class UnavailableServiceException(ApiGatewayException):
+    """Exception to be raised when a service cannot be reached."""
+
+
+class CircuitOpenException(UnavailableServiceException):
+    """Exception to be raised when a service circuit is open, so the call is not even tried."""
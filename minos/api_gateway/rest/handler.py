@@ -1,20 +1,44 @@
-import json
+import asyncio
+import base64
+import collections
+import functools
 import logging
+import random
+import re
 import secrets
 from datetime import (
     datetime,
 )
+from hashlib import (
+    blake2b,
+)
+from time import (
+    monotonic,
+    time,
+)
 from typing import (
     Any,
+    Callable,
+    Hashable,
     Optional,
+    Union,
 )
 
+import orjson
 from aiohttp import (
+    ClientConnectionError,
     ClientConnectorError,
+    ClientError,
     ClientResponse,
     ClientSession,
+    ServerDisconnectedError,
+    StreamReader,
     web,
 )
+from multidict import (
+    CIMultiDict,
+    CIMultiDictProxy,
+)
 from yarl import (
     URL,
 )
@@ -27,52 +51,294 @@ from minos.api_gateway.rest.urlmatch.authmatch import (
     AuthMatch,
 )
 
+from .breakers import (
+    CircuitBreaker,
+)
 from .database.repository import (
     Repository,
 )
+from .exceptions import (
+    CircuitOpenException,
+    NoTokenException,
+    UnavailableServiceException,
+)
 from .urlmatch.autzmatch import (
     AutzMatch,
 )
 
 logger = logging.getLogger(__name__)
 
+DISCOVERY_RECORD = collections.namedtuple("DiscoveryRecord", "address port")
 
-async def orchestrate(request: web.Request) -> web.Response:
-    """ Orchestrate discovery and microservice call """
-    discovery_host = request.app["config"].discovery.host
-    discovery_port = request.app["config"].discovery.port
+DISCOVERY_CACHE_MAX_SIZE = 10_000
+
+BATCH_MAX_SIZE = 100
+BATCH_ITEM_MAX_BODY_SIZE = 1024 * 1024
+
+AUTH_CACHE_MAX_SIZE = 10_000
+AUTH_CACHE_TTL = 60.0
+
+CACHED_RESPONSE = collections.namedtuple("CachedResponse", "vary vary_values status reason headers body expires_at")
+
+RESPONSE_CACHE_MAX_SIZE = 1_000
+RESPONSE_CACHE_MAX_BODY_SIZE = 256 * 1024
+
+REQUEST_RETRIES = 2
+REQUEST_RETRY_BASE_DELAY = 0.05
 
+# The requests with any other method may change the state of the called service.
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+
+# A disconnection may happen after sending the request, so it is only retried if repeating the request is harmless.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+# The sub-requests inherit the batch headers (i.e. 'Authorization'), but not the ones describing the batch body.
+_BATCH_EXCLUDED_HEADERS = frozenset({"content-length", "content-type"})
+
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+
+async def orchestrate(request: web.Request) -> web.StreamResponse:
+    """ Orchestrate discovery and microservice call """
     verb = request.method
     url = f"/{request.match_info['endpoint']}"
 
-    discovery_data = await discover(discovery_host, int(discovery_port), "/microservices", verb, url)
+    if verb == "GET" and (cached := _get_cached_response(request)) is not None:
+        await get_user(request)  # The auth rules are also enforced for the cached responses.
+        return cached
 
-    auth = request.app["config"].rest.auth
-    user = None
-    if auth is not None and auth.enabled:
-        if await check_authentication(
-            request=request, service=request.url.parts[1], url=str(request.url), method=request.method
-        ):
-            response = await validate_token(request)
-            user = json.loads(response)
-            user = user["uuid"]
-
-        if await check_authorization(
-            request=request, service=request.url.parts[1], url=str(request.url), method=request.method
-        ):
-            response = await validate_token(request)
-            data = json.loads(response)
-            user = data["uuid"]
-            role = data["role"]
-            if not await is_authorized_role(
-                request=request, role=role, service=request.url.parts[1], url=str(request.url), method=request.method
-            ):
-                return web.HTTPUnauthorized()
+    record, user = await _resolve(request, verb, url)
 
-    microservice_response = await call(**discovery_data, original_req=request, user=user)
+    try:
+        microservice_response = await call(
+            address=record.address,
+            port=record.port,
+            session=request.app["upstream_session"],
+            original_req=request,
+            user=user,
+        )
+    except web.HTTPServiceUnavailable:
+        _forget_discovery(request.app, verb, url)
+        raise
     return microservice_response
 
 
+async def orchestrate_batch(request: web.Request) -> web.Response:
+    """Orchestrate a batch of microservice calls received within a single request.
+
+    The request body must be a list of ``{"method": ..., "path": ..., "headers": ..., "body": ...}`` objects, where
+    ``headers`` and ``body`` are optional. The calls are performed concurrently and the response body is the list of
+    their ``{"status": ..., "headers": ..., "body": ...}`` results, in the same order. The bodies that are not UTF-8
+    text are base64 encoded and their result also contains ``"encoding": "base64"``. The calls whose response body is
+    larger than ``BATCH_ITEM_MAX_BODY_SIZE`` bytes retrieve a ``502`` result.
+
+    :param request: The original request.
+    :return: The web response to be retrieved to the client.
+    """
+    # A request cannot be cloned after reading its body, so the sub-requests are cloned from an unread copy.
+    template = request.clone()
+
+    try:
+        items = await request.json(loads=orjson.loads)
+    except ValueError:
+        raise web.HTTPBadRequest(text="The batch must be a JSON list.")
+
+    if not isinstance(items, list):
+        raise web.HTTPBadRequest(text="The batch must be a JSON list.")
+
+    if len(items) > BATCH_MAX_SIZE:
+        raise web.HTTPBadRequest(text=f"The batch cannot contain more than {BATCH_MAX_SIZE} calls.")
+
+    calls = [_build_batch_call(template, item) for item in items]
+    results = await asyncio.gather(*(_call_batch_item(sub_request, body) for sub_request, body in calls))
+
+    return web.json_response(results, dumps=_dumps)
+
+
+def _build_batch_call(request: web.Request, item: Any) -> tuple[web.Request, Optional[bytes]]:
+    if (
+        not isinstance(item, dict)
+        or not isinstance(item.get("method"), str)
+        or not isinstance(item.get("path"), str)
+        or not item["path"].startswith("/")
+        or item["path"].startswith("//")
+    ):
+        raise web.HTTPBadRequest(text="Each batch call must contain a 'method' and an absolute 'path'.")
+
+    item_headers = item.get("headers") or dict()
+    if not isinstance(item_headers, dict):
+        raise web.HTTPBadRequest(text="The batch call 'headers' must be a JSON object.")
+
+    headers = CIMultiDict((k, v) for k, v in request.headers.items() if k.lower() not in _BATCH_EXCLUDED_HEADERS)
+    headers.update((k, str(v)) for k, v in item_headers.items())
+    # The sub-responses are embedded into the batch response, so they must not be compressed.
+    headers.popall("Accept-Encoding", None)
+
+    body = item.get("body")
+    if isinstance(body, str):
+        body = body.encode()
+    elif body is not None:
+        body = orjson.dumps(body)
+        headers.setdefault("Content-Type", "application/json")
+
+    sub_request = request.clone(method=item["method"].upper(), rel_url=URL(item["path"]), headers=headers)
+    return sub_request, body
+
+
+async def _call_batch_item(request: web.Request, body: Optional[bytes]) -> dict[str, Any]:
+    # Each call retrieves its own result, so that a failure does not abort the whole batch.
+    try:
+        try:
+            record, user = await _resolve(request, request.method, request.rel_url.path)
+            try:
+                return await _forward_batch_item(request, record, user, body)
+            except web.HTTPServiceUnavailable:
+                _forget_discovery(request.app, request.method, request.rel_url.path)
+                raise
+        except (ClientConnectionError, asyncio.TimeoutError):
+            raise web.HTTPServiceUnavailable(text="The requested endpoint is not available.")
+        except ClientError:
+            raise web.HTTPBadGateway(text="The requested endpoint response is wrong.")
+    except web.HTTPException as exc:
+        return {"status": exc.status, "headers": dict(), "body": exc.text}
+
+
+def _unavailable_as(exc_type: type[web.HTTPException], text: str) -> Callable[[Callable], Callable]:
+    """Retrieve the given http error when the decorated coroutine function cannot reach the requested service.
+
+    If the service circuit is open, a ``503`` is retrieved instead, as the service has not even been called.
+
+    :param exc_type: The http exception class to be raised.
+    :param text: The text of the http exception.
+    :return: The decorator.
+    """
+
+    def _decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def _wrapper(*args, **kwargs) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except CircuitOpenException:
+                raise web.HTTPServiceUnavailable(text=text)
+            except UnavailableServiceException:
+                raise exc_type(text=text)
+
+        return _wrapper
+
+    return _decorator
+
+
+@_unavailable_as(web.HTTPServiceUnavailable, "The requested endpoint is not available.")
+async def _forward_batch_item(
+    request: web.Request, record: DISCOVERY_RECORD, user: Optional[str], body: Optional[bytes]
+) -> dict[str, Any]:
+    headers = _build_call_headers(request, user)
+    url = _build_call_url(request, record.address, record.port)
+    session = request.app["upstream_session"]
+    breaker = request.app["breakers"][f"{record.address}:{record.port}"]
+
+    async with await _call_with_retry(
+        session, request.method, url, breaker=breaker, headers=headers, data=body
+    ) as response:
+        _invalidate_cached_responses(request, response)
+        result = {
+            "status": response.status,
+            "headers": {str(k): v for k, v in _filter_hop_by_hop(response.headers, "content-length").items()},
+        }
+        if response.content_length is not None and response.content_length > BATCH_ITEM_MAX_BODY_SIZE:
+            raise web.HTTPBadGateway(text="The requested endpoint response is too large.")
+
+        # The body is read in chunks, so that the limit is also enforced when the length is not known in advance.
+        buffer = bytearray()
+        async for chunk in response.content.iter_any():
+            buffer.extend(chunk)
+            if len(buffer) > BATCH_ITEM_MAX_BODY_SIZE:
+                raise web.HTTPBadGateway(text="The requested endpoint response is too large.")
+        body = bytes(buffer)
+
+    if "Content-Encoding" not in response.headers:
+        try:
+            result["body"] = body.decode()
+            return result
+        except UnicodeDecodeError:
+            pass
+
+    result["body"] = base64.b64encode(body).decode()
+    result["encoding"] = "base64"
+    return result
+
+
+def _dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+async def _resolve(request: web.Request, verb: str, endpoint: str) -> tuple[DISCOVERY_RECORD, Optional[str]]:
+    # Discovery and authentication are independent, so both are awaited concurrently. As soon as one of them fails,
+    # the other one is cancelled, as its outcome is not needed anymore.
+    tasks = (asyncio.ensure_future(discover(request.app, verb, endpoint)), asyncio.ensure_future(get_user(request)))
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    exceptions = [task.exception() for task in tasks if task in done]
+    for exc in exceptions:
+        if exc is not None:
+            raise exc
+
+    record, user = (task.result() for task in tasks)
+    return record, user
+
+
+async def get_user(request: web.Request) -> Optional[str]:
+    """Get the user that makes the request, validating its token if the requested endpoint requires it.
+
+    :param request: The original request.
+    :return: The user identifier, or ``None`` if the requested endpoint is not protected.
+    """
+    auth = request.app["auth_config"]
+    if auth is None or not auth.enabled:
+        return None
+
+    service, url, method = request.url.parts[1], str(request.url), request.method
+
+    if "Authorization" not in request.headers:  # Anonymous requests are only forwarded to unprotected endpoints.
+        protected = await check_authentication(request=request, service=service, url=url, method=method)
+        if not protected:
+            protected = await check_authorization(request=request, service=service, url=url, method=method)
+        if protected:
+            raise web.HTTPUnauthorized(text="The given request does not have authorization to be forwarded.")
+        return None
+
+    user = None
+    if await check_authentication(request=request, service=service, url=url, method=method):
+        data = await validate_token(request)
+        user = data["uuid"]
+
+    if await check_authorization(request=request, service=service, url=url, method=method):
+        data = await validate_token(request)
+        user = data["uuid"]
+        role = data["role"]
+        if not await is_authorized_role(request=request, role=role, service=service, url=url, method=method):
+            raise web.HTTPUnauthorized()
+
+    return user
+
+
 async def check_authentication(request: web.Request, service: str, url: str, method: str) -> bool:
     records = Repository(request.app["db_engine"]).get_auth_rule_by_service(service)
     return AuthMatch.match(url=url, method=method, records=records)
@@ -88,146 +354,516 @@ async def is_authorized_role(request: web.Request, role: int, service: str, url:
     return AutzMatch.match(url=url, role=role, method=method, records=records)
 
 
-async def authentication_default(request: web.Request) -> web.Response:
+async def authentication_default(request: web.Request) -> web.StreamResponse:
     """ Orchestrate discovery and microservice call """
-    auth_host = request.app["config"].rest.auth.host
-    auth_port = request.app["config"].rest.auth.port
-    auth_path = request.app["config"].rest.auth.path
-    default_service = request.app["config"].rest.auth.default
+    return await authentication_call(request, request.app["auth_default_url"])
 
-    url = URL(f"http://{auth_host}:{auth_port}{auth_path}/{default_service}")
 
-    return await authentication_call(request, url)
+async def login_default(request: web.Request) -> web.StreamResponse:
+    """ Orchestrate discovery and microservice call """
+    return await authentication_call(request, request.app["auth_login_default_url"])
 
 
-async def login_default(request: web.Request) -> web.Response:
+async def authentication(request: web.Request) -> web.StreamResponse:
     """ Orchestrate discovery and microservice call """
-    auth_host = request.app["config"].rest.auth.host
-    auth_port = request.app["config"].rest.auth.port
-    auth_path = request.app["config"].rest.auth.path
-    default_service = request.app["config"].rest.auth.default
-
-    url = URL(f"http://{auth_host}:{auth_port}{auth_path}/{default_service}/login")
+    url = URL(request.path)
 
     return await authentication_call(request, url)
 
 
-async def authentication(request: web.Request) -> web.Response:
+@_unavailable_as(web.HTTPServiceUnavailable, "The requested endpoint is not available.")
+async def authentication_call(request: web.Request, url: URL) -> web.StreamResponse:
     """ Orchestrate discovery and microservice call """
+    session = request.app["auth_session"]
+    breaker = request.app["breakers"]["auth"]
+    data = await _get_body(request)
 
-    auth_host = request.app["config"].rest.auth.host
-    auth_port = request.app["config"].rest.auth.port
+    async with await _call_with_retry(
+        session, request.method, url, breaker=breaker, headers=request.headers, data=data
+    ) as response:
+        return await _stream_response(response, request, decompressed=True)
 
-    url = URL(f"http://{auth_host}:{auth_port}{request.path}")
 
-    return await authentication_call(request, url)
+def get_token(request: web.Request) -> str:
+    """Get the bearer token from the ``Authorization`` header of the request.
 
+    :param request: The original request.
+    :return: The token.
+    :raises NoTokenException: If the request does not contain a bearer token.
+    """
+    auth = request.headers.get("Authorization")
+    if auth is None or not auth.startswith("Bearer "):
+        raise NoTokenException("The request does not contain a bearer token.")
 
-async def authentication_call(request: web.Request, url: URL) -> web.Response:
-    """ Orchestrate discovery and microservice call """
-    headers = request.headers.copy()
-    data = await request.read()
+    token = auth[7:].strip()
+    if not token:
+        raise NoTokenException("The request does not contain a bearer token.")
+    return token
+
+
+async def validate_token(request: web.Request) -> dict[str, Any]:
+    """Validate the request token against the auth service, using the cached validation if it is still fresh.
+
+    Concurrent misses for the same token share a single call to the auth service.
 
+    :param request: The original request.
+    :return: The token data retrieved by the auth service.
+    """
     try:
-        async with ClientSession() as session:
-            async with session.request(headers=headers, method=request.method, url=url, data=data) as response:
-                return await _clone_response(response)
-    except ClientConnectorError:
-        raise web.HTTPServiceUnavailable(text="The requested endpoint is not available.")
+        token = get_token(request)
+    except NoTokenException:  # There is no need to ask the auth service.
+        raise web.HTTPUnauthorized(text="The given request does not have authorization to be forwarded.")
 
+    # The token is hashed so that it is not kept in memory as it is.
+    key = blake2b(token.encode(), digest_size=16).digest()
+    cache = request.app["auth_cache"]
 
-async def validate_token(request: web.Request):
-    """ Orchestrate discovery and microservice call """
-    auth_host = request.app["config"].rest.auth.host
-    auth_port = request.app["config"].rest.auth.port
-    auth_path = request.app["config"].rest.auth.path
+    if (data := _get_cached_auth(cache, key)) is not None:
+        return data
+
+    data = await _single_flight(request.app["auth_inflight"], key, _validate_token, request, key)
+    return dict(data)
+
+
+@_unavailable_as(web.HTTPServiceUnavailable, "The requested endpoint is not available.")
+async def _validate_token(request: web.Request, key: bytes) -> dict[str, Any]:
+    session = request.app["auth_session"]
+    auth_url = request.app["auth_validate_url"]
+    breaker = request.app["breakers"]["auth"]
+
+    body = await request.read()
+
+    async with await _call_with_retry(
+        session, "POST", auth_url, breaker=breaker, data=body, headers=request.headers
+    ) as response:
+        if not response.ok:
+            raise web.HTTPUnauthorized(text="The given request does not have authorization to be forwarded.")
+        data = orjson.loads(await response.read())
+
+    ttl = AUTH_CACHE_TTL
+    if isinstance(data.get("exp"), (int, float)):
+        ttl = min(ttl, data["exp"] - time())
+    if ttl > 0:
+        cache = request.app["auth_cache"]
+        cache[key] = (data, monotonic() + ttl)
+        if len(cache) > AUTH_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
+    return data
 
-    auth_url = URL(f"http://{auth_host}:{auth_port}{auth_path}/validate-token")
 
-    headers = request.headers.copy()
-    data = await request.read()
+def _get_cached_auth(cache: collections.OrderedDict[bytes, tuple[dict, float]], key: bytes) -> Optional[dict]:
+    try:
+        data, expires_at = cache[key]
+    except KeyError:
+        return None
+
+    if monotonic() >= expires_at:
+        del cache[key]
+        return None
+
+    cache.move_to_end(key)
+    return dict(data)
+
+
+async def discover(app: web.Application, verb: str, endpoint: str) -> DISCOVERY_RECORD:
+    """Get microservice connection data, using the cached discovery response if it is still fresh.
+
+    Concurrent misses for the same ``(verb, endpoint)`` pair share a single call to the discovery service.
+
+    :param app: The application.
+    :param verb: Endpoint Verb.
+    :param endpoint: Endpoint url.
+    :return: A ``DISCOVERY_RECORD`` NamedTuple instance.
+    """
+    key = (verb, endpoint)
+    cache = app["discovery_cache"]
+
+    if (record := _get_cached_discovery(cache, key)) is not None:
+        return record
 
+    return await _single_flight(app["discovery_inflight"], key, _discover_and_cache, app, verb, endpoint)
+
+
+async def _discover_and_cache(app: web.Application, verb: str, endpoint: str) -> DISCOVERY_RECORD:
+    record, max_age = await _discover(
+        app["discovery_session"], app["discovery_url"], verb, endpoint, breaker=app["breakers"]["discovery"]
+    )
+
+    ttl = max_age if max_age is not None else app["discovery_config"].cache_ttl
+    if ttl > 0:
+        cache = app["discovery_cache"]
+        if len(cache) >= DISCOVERY_CACHE_MAX_SIZE:
+            del cache[next(iter(cache))]
+        cache[(verb, endpoint)] = (record, monotonic() + ttl)
+
+    return record
+
+
+def _forget_discovery(app: web.Application, verb: str, endpoint: str) -> None:
+    # The service may have been moved to another address, so it is discovered again on the next request.
+    app["discovery_cache"].pop((verb, endpoint), None)
+
+
+def _get_cached_discovery(
+    cache: dict[tuple[str, str], tuple[DISCOVERY_RECORD, float]], key: tuple[str, str]
+) -> Optional[DISCOVERY_RECORD]:
     try:
-        async with ClientSession() as session:
-            async with session.request(method="POST", url=auth_url, data=data, headers=headers) as response:
-                resp = await _clone_response(response)
+        record, expires_at = cache[key]
+    except KeyError:
+        return None
 
-                if not response.ok:
-                    raise web.HTTPUnauthorized(text="The given request does not have authorization to be forwarded.")
-                return resp.text
+    if monotonic() >= expires_at:
+        del cache[key]
+        return None
 
-    except ClientConnectorError:
-        raise web.HTTPServiceUnavailable(text="The requested endpoint is not available.")
+    return record
 
 
-async def discover(host: str, port: int, path: str, verb: str, endpoint: str) -> dict[str, Any]:
+@_unavailable_as(web.HTTPGatewayTimeout, "The Discovery Service is not available.")
+async def _discover(
+    session: ClientSession, url: URL, verb: str, endpoint: str, breaker: CircuitBreaker
+) -> tuple[DISCOVERY_RECORD, Optional[int]]:
     """Call discovery service and get microservice connection data.
 
-    :param host: Discovery host name.
-    :param port: Discovery port.
-    :param path: Discovery path.
+    :param session: The client session connected to the discovery service.
+    :param url: Discovery url, relative to the session base url.
     :param verb: Endpoint Verb.
     :param endpoint: Endpoint url.
-    :return: The response of the discovery.
+    :param breaker: The circuit breaker of the discovery service.
+    :return: A ``DISCOVERY_RECORD`` NamedTuple instance and the response ``max-age``, if any.
     """
 
-    url = URL.build(scheme="http", host=host, port=port, path=path, query={"verb": verb, "path": endpoint})
+    async with await _call_with_retry(
+        session, "GET", url.with_query(verb=verb, path=endpoint), breaker=breaker
+    ) as response:
+        if not response.ok:
+            if response.status == 404:
+                raise web.HTTPNotFound(text=f"The {endpoint!r} path is not available for {verb!r} method.")
+            raise web.HTTPBadGateway(text="The Discovery Service response is wrong.")
+
+        data = await response.json(loads=orjson.loads)
+        max_age = _get_max_age(response.headers.get("Cache-Control"))
+
     try:
-        async with ClientSession() as session:
-            async with session.get(url=url) as response:
-                if not response.ok:
-                    if response.status == 404:
-                        raise web.HTTPNotFound(text=f"The {endpoint!r} path is not available for {verb!r} method.")
-                    raise web.HTTPBadGateway(text="The Discovery Service response is wrong.")
+        address = data["address"]
+        if not isinstance(address, str):
+            raise TypeError(f"The address must be a string. Obtained: {address!r}")
+        record = DISCOVERY_RECORD(address=address.strip().lower(), port=int(data["port"]))
+    except (KeyError, TypeError, ValueError):
+        raise web.HTTPBadGateway(text="The Discovery Service response is wrong.")
 
-                data = await response.json()
-    except ClientConnectorError:
-        raise web.HTTPGatewayTimeout(text="The Discovery Service is not available.")
+    return record, max_age
 
-    data["port"] = int(data["port"])
 
-    return data
+def _get_max_age(cache_control: Optional[str]) -> Optional[int]:
+    if cache_control is None:
+        return None
+
+    cache_control = cache_control.lower()
+
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    if match is None:
+        return None
+    return int(match.group(1))
+
+
+async def _single_flight(inflight: dict[Hashable, asyncio.Task], key: Hashable, fn: Callable, *args) -> Any:
+    """Await ``fn(*args)``, sharing its outcome with any concurrent call performed with the same key.
+
+    The shared call runs on its own task, so cancelling any of the callers (i.e. when its client disconnects) does not
+    affect the other ones.
+
+    :param inflight: The tasks of the calls that are currently running, indexed by key.
+    :param key: The key that identifies equivalent calls.
+    :param fn: The coroutine function to be called.
+    :param args: The positional arguments of the function.
+    :return: The value returned by the function.
+    """
+    if (task := inflight.get(key)) is None:
+        task = inflight[key] = asyncio.ensure_future(fn(*args))
+        task.add_done_callback(functools.partial(_release_single_flight, inflight, key))
+
+    try:
+        return await asyncio.shield(task)
+    except web.HTTPException as exc:  # Each handler must retrieve its own response instance.
+        raise type(exc)(text=exc.text)
+
+
+def _release_single_flight(inflight: dict[Hashable, asyncio.Task], key: Hashable, task: asyncio.Task) -> None:
+    if inflight.get(key) is task:
+        del inflight[key]
+    if not task.cancelled():
+        task.exception()  # Avoid the "never retrieved" warning when all the callers have been cancelled.
+
+
+async def _call_with_retry(
+    session: ClientSession,
+    method: str,
+    url: Union[str, URL],
+    *,
+    breaker: CircuitBreaker,
+    retries: int = REQUEST_RETRIES,
+    base_delay: float = REQUEST_RETRY_BASE_DELAY,
+    **kwargs,
+) -> ClientResponse:
+    """Perform a request, retrying it with exponential backoff when the connection fails.
+
+    The failures are recorded on the given circuit breaker, so that the requests fail fast while it is open.
+
+    :param session: The client session used to perform the request.
+    :param method: The request method.
+    :param url: The request url.
+    :param breaker: The circuit breaker of the requested service.
+    :param retries: The maximum number of retries.
+    :param base_delay: The delay before the first retry, in seconds. It is doubled on each retry.
+    :param kwargs: Additional named arguments passed to the request.
+    :return: The client response, which must be released by the caller.
+    :raises CircuitOpenException: If the circuit is open.
+    :raises UnavailableServiceException: If the connection failed on every attempt.
+    """
+    if breaker.is_open:
+        raise CircuitOpenException(f"The circuit of {url!r} is open.")
+
+    # A streamed body is consumed while it is sent, so it can only be retried if the connection was never established.
+    errors = (ClientConnectorError,)
+    if method in _IDEMPOTENT_METHODS and not isinstance(kwargs.get("data"), StreamReader):
+        errors += (ServerDisconnectedError,)
+
+    attempt = 0
+    while True:
+        try:
+            response = await session.request(method, url, **kwargs)
+        except (ClientConnectorError, ServerDisconnectedError) as exc:
+            if attempt >= retries or not isinstance(exc, errors):
+                breaker.record_failure()
+                raise UnavailableServiceException(f"The request to {url!r} failed: {exc!r}") from exc
+            await asyncio.sleep(base_delay * 2 ** attempt + random.uniform(0, base_delay))
+            attempt += 1
+        else:
+            breaker.record_success()
+            return response
 
 
 # noinspection PyUnusedLocal
-async def call(address: str, port: int, original_req: web.Request, user: Optional[str], **kwargs) -> web.Response:
+@_unavailable_as(web.HTTPServiceUnavailable, "The requested endpoint is not available.")
+async def call(
+    address: str, port: int, session: ClientSession, original_req: web.Request, user: Optional[str], **kwargs
+) -> web.StreamResponse:
     """Call microservice (redirect the original call)
 
     :param address: The ip of the microservices.
     :param port: The port of the microservice.
+    :param session: The client session used to forward the request.
     :param original_req: The original request.
     :param kwargs: Additional named arguments.
     :param user: User that makes the request
     :return: The web response to be retrieved to the client.
     """
 
-    headers = original_req.headers.copy()
-    if user is not None:
-        headers["X-User"] = user
-    else:  # Enforce that the 'User' entry is only generated by the auth system.
-        # noinspection PyTypeChecker
-        headers.pop("X-User", None)
-
-    url = original_req.url.with_scheme("http").with_host(address).with_port(port)
+    headers = _build_call_headers(original_req, user)
+    url = _build_call_url(original_req, address, port)
     method = original_req.method
-    data = await original_req.read()
+    data = await _get_body(original_req)
+
+    breaker = original_req.app["breakers"][f"{address}:{port}"]
 
     logger.info(f"Redirecting {method!r} request to {url!r}...")
 
+    async with await _call_with_retry(session, method, url, breaker=breaker, headers=headers, data=data) as response:
+        _invalidate_cached_responses(original_req, response)
+
+        if (ttl := _get_response_cache_ttl(original_req, response)) is None:
+            return await _stream_response(response, original_req)
+
+        chunks = list()
+        stream = await _stream_response(response, original_req, chunks)
+        _set_cached_response(original_req, response, b"".join(chunks), ttl)
+        return stream
+
+
+def _get_cached_response(request: web.Request) -> Optional[web.Response]:
+    cache_control = request.headers.get("Cache-Control", "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return None
+
+    cache = request.app["response_cache"]
+    key = request.rel_url.raw_path_qs
     try:
-        async with ClientSession() as session:
-            async with session.request(headers=headers, method=method, url=url, data=data) as response:
-                return await _clone_response(response)
-    except ClientConnectorError:
-        raise web.HTTPServiceUnavailable(text="The requested endpoint is not available.")
+        entry = cache[key]
+    except KeyError:
+        return None
+
+    if monotonic() >= entry.expires_at:
+        del cache[key]
+        return None
+
+    if tuple(request.headers.get(name) for name in entry.vary) != entry.vary_values:
+        return None
 
+    cache.move_to_end(key)
+    return web.Response(body=entry.body, status=entry.status, reason=entry.reason, headers=entry.headers)
 
-# noinspection PyMethodMayBeStatic
-async def _clone_response(response: ClientResponse) -> web.Response:
-    return web.Response(
-        body=await response.read(), status=response.status, reason=response.reason, headers=response.headers,
+
+def _get_response_cache_ttl(request: web.Request, response: ClientResponse) -> Optional[int]:
+    """Get the time the response can be cached by the gateway, following the RFC 7234 rules for shared caches.
+
+    Only the complete ``GET`` responses explicitly marked as ``public`` and with a bounded size are cached.
+
+    :param request: The original request.
+    :param response: The response retrieved from the called service.
+    :return: The number of seconds, or ``None`` if the response is not cacheable.
+    """
+    if request.method != "GET" or response.status != 200:
+        return None
+
+    if "Set-Cookie" in response.headers or response.headers.get("Vary", "").strip() == "*":
+        return None
+
+    if response.content_length is None or response.content_length > RESPONSE_CACHE_MAX_BODY_SIZE:
+        return None
+
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "public" not in cache_control or "private" in cache_control:
+        return None
+
+    max_age = _get_max_age(cache_control)
+    if not max_age:
+        return None
+    return max_age
+
+
+def _set_cached_response(request: web.Request, response: ClientResponse, body: bytes, ttl: int) -> None:
+    vary = tuple(name.strip() for name in response.headers.get("Vary", "").split(",") if name.strip())
+    entry = CACHED_RESPONSE(
+        vary=vary,
+        vary_values=tuple(request.headers.get(name) for name in vary),
+        status=response.status,
+        reason=response.reason,
+        headers=_filter_hop_by_hop(response.headers, "content-length", "date"),
+        body=body,
+        expires_at=monotonic() + ttl,
     )
 
+    cache = request.app["response_cache"]
+    cache[request.rel_url.raw_path_qs] = entry
+    cache.move_to_end(request.rel_url.raw_path_qs)
+    if len(cache) > RESPONSE_CACHE_MAX_SIZE:
+        cache.popitem(last=False)
+
+
+def _invalidate_cached_responses(request: web.Request, response: ClientResponse) -> None:
+    """Drop the cached responses that may be stale after a successful request with an unsafe method (RFC 7234 4.4).
+
+    :param request: The original request.
+    :param response: The response retrieved from the called service.
+    :return: This method does not return anything.
+    """
+    if request.method in _SAFE_METHODS or not 200 <= response.status < 400:
+        return
+
+    cache = request.app["response_cache"]
+    cache.pop(request.rel_url.raw_path_qs, None)
+
+    # The targets are resolved by path, as all of them are behind this gateway.
+    for name in ("Location", "Content-Location"):
+        if (value := response.headers.get(name)) is None:
+            continue
+        try:
+            key = URL(value, encoded=True).raw_path_qs
+        except ValueError:
+            continue
+        cache.pop(key, None)
+
+
+def _build_call_headers(request: web.Request, user: Optional[str]) -> CIMultiDict[str]:
+    # The 'Host' entry is dropped so that it is generated from the target url.
+    # The 'User' entry is dropped to enforce that it is only generated by the auth system.
+    headers = _filter_hop_by_hop(request.headers, "host", "x-user")
+    if user is not None:
+        headers["X-User"] = user
+    return headers
+
+
+def _build_call_url(request: web.Request, address: str, port: int) -> URL:
+    return URL(_get_upstream_base(request.app, address, port) + request.rel_url.raw_path_qs, encoded=True)
+
+
+def _get_upstream_base(app: web.Application, address: str, port: int) -> str:
+    key = (address, port)
+    cache = app["upstream_base_cache"]
+    if (base := cache.get(key)) is None:
+        base = cache[key] = str(URL.build(scheme="http", host=address, port=port))
+    return base
+
+
+async def _get_body(request: web.Request) -> Union[bytes, StreamReader, None]:
+    """Get the body to be forwarded, streaming it whenever it has not been consumed yet.
+
+    :param request: The original request.
+    :return: The request body stream, the already read bytes (i.e. after the token validation) or ``None`` if the
+        request does not have body.
+    """
+    if not request.body_exists:
+        return None
+    if request.content.at_eof():
+        return await request.read()
+    return request.content
+
+
+async def _stream_response(
+    response: ClientResponse, request: web.Request, chunks: Optional[list[bytes]] = None, decompressed: bool = False
+) -> web.StreamResponse:
+    """Forward the given client response to the original requester as its chunks arrive.
+
+    :param response: The response retrieved from the called service.
+    :param request: The original request.
+    :param chunks: If set, the forwarded chunks are also appended to it.
+    :param decompressed: If ``True``, the client session has decompressed the body, so it no longer matches the
+        original ``Content-Encoding`` and ``Content-Length`` headers.
+    :return: The already sent stream response.
+    """
+    if decompressed and "Content-Encoding" in response.headers:
+        headers = _filter_hop_by_hop(response.headers, "content-encoding", "content-length")
+    else:
+        headers = _filter_hop_by_hop(response.headers)
+    stream = web.StreamResponse(status=response.status, reason=response.reason, headers=headers)
+
+    if request.method == "HEAD" or response.status < 200 or response.status in (204, 304):
+        # There is no body, so it must not be sent with chunked encoding.
+        if stream.content_length is None:
+            stream.content_length = 0
+        await stream.prepare(request)
+        await stream.write_eof()
+        return stream
+
+    await stream.prepare(request)
+
+    async for chunk in response.content.iter_any():
+        await stream.write(chunk)
+        if chunks is not None:
+            chunks.append(chunk)
+
+    await stream.write_eof()
+    return stream
+
+
+def _filter_hop_by_hop(headers: CIMultiDictProxy[str], *extra: str) -> CIMultiDict[str]:
+    """Copy the given headers without the hop-by-hop ones, in a single pass.
+
+    :param headers: The headers to be filtered.
+    :param extra: Additional lowercase header names to be dropped.
+    :return: A new ``CIMultiDict`` instance.
+    """
+    excluded = _HOP_BY_HOP_HEADERS.union(extra)
+    for connection in headers.getall("Connection", ()):
+        excluded = excluded.union(token.strip().lower() for token in connection.split(","))
+
+    return CIMultiDict((k, v) for k, v in headers.items() if k.lower() not in excluded)
+
 
 class AdminHandler:
     @staticmethod
@@ -252,34 +888,28 @@ class AdminHandler:
             return web.json_response({"error": "Something went wrong!."}, status=web.HTTPUnauthorized.status_code)
 
     @staticmethod
-    async def get_endpoints(request: web.Request) -> web.Response:
-        discovery_host = request.app["config"].discovery.host
-        discovery_port = request.app["config"].discovery.port
-
-        url = URL.build(scheme="http", host=discovery_host, port=discovery_port, path="/endpoints")
+    async def get_endpoints(request: web.Request) -> web.StreamResponse:
+        session = request.app["discovery_session"]
+        breaker = request.app["breakers"]["discovery"]
 
         try:
-            async with ClientSession() as session:
-                async with session.get(url=url) as response:
-                    return await _clone_response(response)
-        except ClientConnectorError:
+            async with await _call_with_retry(session, "GET", "/endpoints", breaker=breaker) as response:
+                return await _stream_response(response, request, decompressed=True)
+        except UnavailableServiceException:
             return web.json_response(
                 {"error": "The requested endpoint is not available."}, status=web.HTTPServiceUnavailable.status_code
             )
 
     @staticmethod
-    async def get_roles(request: web.Request) -> web.Response:
-        auth_host = request.app["config"].rest.auth.host
-        auth_port = request.app["config"].rest.auth.port
-        auth_path = request.app["config"].rest.auth.path
-
-        url = URL.build(scheme="http", host=auth_host, port=auth_port, path=f"{auth_path}/roles")
+    async def get_roles(request: web.Request) -> web.StreamResponse:
+        session = request.app["auth_session"]
+        auth_path = request.app["auth_config"].path
+        breaker = request.app["breakers"]["auth"]
 
         try:
-            async with ClientSession() as session:
-                async with session.get(url=url) as response:
-                    return await _clone_response(response)
-        except ClientConnectorError:
+            async with await _call_with_retry(session, "GET", f"{auth_path}/roles", breaker=breaker) as response:
+                return await _stream_response(response, request, decompressed=True)
+        except UnavailableServiceException:
             return web.json_response(
                 {"error": "The requested endpoint is not available."}, status=web.HTTPServiceUnavailable.status_code
             )
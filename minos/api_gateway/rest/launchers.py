@@ -41,6 +41,9 @@ class EntrypointLauncher:
     def entrypoint(self) -> Entrypoint:
         """Entrypoint instance.
 
+        The event loop is created with the ``uvloop`` policy whenever ``uvloop`` is installed, as the gateway does not
+        rely on any selector-specific loop feature.
+
         :return: An ``Entrypoint`` instance.
         """
 
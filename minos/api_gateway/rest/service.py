@@ -1,4 +1,8 @@
 import logging
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
 from pathlib import (
     Path,
 )
@@ -6,18 +10,33 @@ from pathlib import (
 import aiohttp_jinja2
 import jinja2
 from aiohttp import (
+    ClientSession,
+    TCPConnector,
     web,
 )
 from aiohttp_middlewares import (
     cors_middleware,
 )
+from aiohttp_middlewares.cors import (
+    ACCESS_CONTROL_ALLOW_HEADERS,
+    ACCESS_CONTROL_ALLOW_METHODS,
+    ACCESS_CONTROL_ALLOW_ORIGIN,
+    DEFAULT_ALLOW_HEADERS,
+    DEFAULT_ALLOW_METHODS,
+)
 from aiomisc.service.aiohttp import (
     AIOHTTPService,
 )
 from sqlalchemy import (
     create_engine,
 )
+from yarl import (
+    URL,
+)
 
+from .breakers import (
+    CircuitBreaker,
+)
 from .config import (
     ApiGatewayConfig,
 )
@@ -30,6 +49,7 @@ from .handler import (
     authentication_default,
     login_default,
     orchestrate,
+    orchestrate_batch,
 )
 
 logger = logging.getLogger(__name__)
@@ -47,15 +67,38 @@ class ApiGatewayRestService(AIOHTTPService):
             middlewares = [cors_middleware(allow_all=True)]
 
         app = web.Application(middlewares=middlewares)
+        if self.config.rest.cors.enabled:
+            app.on_response_prepare.append(self.add_cors_headers)
 
         app["config"] = self.config
+        # The config values read while handling the requests are resolved only once.
+        app["auth_config"] = self.config.rest.auth
+        app["discovery_config"] = self.config.discovery
 
         self.engine = await self.create_engine()
         await self.create_database()
 
         app["db_engine"] = self.engine
 
-        auth = self.config.rest.auth
+        # The urls are relative to the base url of the corresponding client session.
+        app["discovery_url"] = URL("/microservices")
+        auth = app["auth_config"]
+        if auth is not None:
+            app["auth_validate_url"] = URL(f"{auth.path}/validate-token")
+            app["auth_default_url"] = URL(f"{auth.path}/{auth.default}")
+            app["auth_login_default_url"] = URL(f"{auth.path}/{auth.default}/login")
+
+        app["discovery_cache"] = dict()
+        app["discovery_inflight"] = dict()
+        app["auth_cache"] = OrderedDict()
+        app["auth_inflight"] = dict()
+        app["upstream_base_cache"] = dict()
+        app["response_cache"] = OrderedDict()
+        app["breakers"] = defaultdict(CircuitBreaker)
+
+        app.on_startup.append(self.create_sessions)
+        app.on_cleanup.append(self.close_sessions)
+
         if auth is not None and auth.enabled:
             app.router.add_route("*", "/auth", authentication_default)
             app.router.add_route("*", "/auth/login", login_default)
@@ -82,10 +125,79 @@ class ApiGatewayRestService(AIOHTTPService):
         app.router.add_route("*", "/administration{path:.*}", self.handler)
         # app.router.add_route("GET", "/administration/{filename:.*}", self._serve_files)
 
+        # The gateway's own routes are kept under a reserved prefix, so that they do not hide any microservice route.
+        app.router.add_route("POST", "/gateway/batch", orchestrate_batch)
         app.router.add_route("*", "/{endpoint:.*}", orchestrate)
 
         return app
 
+    async def create_sessions(self, app: web.Application) -> None:
+        """Create the http client sessions shared by all the requests handled by the application.
+
+        :param app: The application.
+        :return: This method does not return anything.
+        """
+        discovery = self.config.discovery
+        app["discovery_session"] = ClientSession(
+            base_url=URL.build(scheme="http", host=discovery.host, port=discovery.port),
+            connector=self._create_connector(limit_per_host=256),
+        )
+
+        auth = self.config.rest.auth
+        if auth is not None:
+            app["auth_session"] = ClientSession(
+                base_url=URL.build(scheme="http", host=auth.host, port=auth.port),
+                connector=self._create_connector(limit_per_host=256),
+            )
+
+        # The microservices are served over cleartext HTTP/1.1, so the upstream connections are shared through the
+        # keep-alive pool instead of HTTP/2 streams. The bodies are streamed to the client as they are, so they must
+        # not be decompressed.
+        app["upstream_session"] = ClientSession(
+            connector=self._create_connector(limit_per_host=64), auto_decompress=False
+        )
+
+    @staticmethod
+    def _create_connector(limit_per_host: int) -> TCPConnector:
+        # There is no global limit, so each host is only bounded by its own ``limit_per_host``.
+        return TCPConnector(
+            limit=0,
+            limit_per_host=limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+
+    @staticmethod
+    async def add_cors_headers(request: web.Request, response: web.StreamResponse) -> None:
+        """Add the CORS headers just before sending the response headers.
+
+        The proxied responses are streamed, so their headers are already sent when the CORS middleware gets them.
+
+        :param request: The original request.
+        :param response: The response to be sent.
+        :return: This method does not return anything.
+        """
+        if "Origin" not in request.headers:
+            return
+
+        response.headers[ACCESS_CONTROL_ALLOW_ORIGIN] = "*"
+        if request.method == "OPTIONS":
+            response.headers[ACCESS_CONTROL_ALLOW_HEADERS] = ", ".join(DEFAULT_ALLOW_HEADERS)
+            response.headers[ACCESS_CONTROL_ALLOW_METHODS] = ", ".join(DEFAULT_ALLOW_METHODS)
+
+    @staticmethod
+    async def close_sessions(app: web.Application) -> None:
+        """Close the http client sessions created on the application startup.
+
+        :param app: The application.
+        :return: This method does not return anything.
+        """
+        for key in ("discovery_session", "auth_session", "upstream_session"):
+            if key in app:
+                await app[key].close()
+
     async def create_engine(self):
         DATABASE_URI = (
             f"postgresql+psycopg2://{self.config.database.user}:{self.config.database.password}@"
@@ -1,3 +1,4 @@
+import gzip
 import json
 import os
 import unittest
@@ -9,6 +10,9 @@ from aiohttp.test_utils import (
     AioHTTPTestCase,
     unittest_run_loop,
 )
+from flask import (
+    Response,
+)
 
 from minos.api_gateway.rest import (
     ApiGatewayConfig,
@@ -116,6 +120,51 @@ class TestApiGatewayAdminEndpoints(AioHTTPTestCase):
         self.assertIn("two", await response.text())
 
 
+class TestApiGatewayAdminEndpointsCompressed(AioHTTPTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "config.yml"
+
+    @mock.patch.dict(os.environ, {"API_GATEWAY_REST_CORS_ENABLED": "true"})
+    def setUp(self) -> None:
+        self.config = ApiGatewayConfig(self.CONFIG_FILE_PATH)
+
+        self.discovery = MockServer(host=self.config.discovery.host, port=self.config.discovery.port,)
+        self.discovery.add_callback_response(
+            "/endpoints",
+            lambda: Response(
+                gzip.compress(json.dumps([{"one": 1}, {"two": 2}]).encode()),
+                headers={"Content-Encoding": "gzip"},
+                mimetype="application/json",
+            ),
+        )
+
+        self.discovery.start()
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.discovery.shutdown_server()
+        super().tearDown()
+
+    async def get_application(self):
+        """
+        Override the get_app method to return your application.
+        """
+        rest_service = ApiGatewayRestService(
+            address=self.config.rest.host, port=self.config.rest.port, config=self.config
+        )
+
+        return await rest_service.create_application()
+
+    @unittest_run_loop
+    async def test_admin_get_endpoints(self):
+        url = "/admin/endpoints"
+
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(200, response.status)
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual([{"one": 1}, {"two": 2}], json.loads(await response.read()))
+
+
 class TestApiGatewayAdminEndpointsUnavailable(AioHTTPTestCase):
     CONFIG_FILE_PATH = BASE_PATH / "config.yml"
 
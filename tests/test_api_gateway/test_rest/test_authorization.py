@@ -12,6 +12,9 @@ from aiohttp.test_utils import (
     AioHTTPTestCase,
     unittest_run_loop,
 )
+from flask import (
+    jsonify,
+)
 from werkzeug.exceptions import (
     abort,
 )
@@ -147,6 +150,70 @@ class TestApiGatewayAuthorization(AioHTTPTestCase):
         self.assertIn("Microservice call correct!!!", await response.text())
 
 
+class TestAutzAnonymous(AioHTTPTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "config.yml"
+
+    @mock.patch.dict(os.environ, {"API_GATEWAY_REST_AUTH_ENABLED": "true"})
+    def setUp(self) -> None:
+        self.config = ApiGatewayConfig(self.CONFIG_FILE_PATH)
+
+        self.discovery = MockServer(host=self.config.discovery.host, port=self.config.discovery.port,)
+        self.discovery.add_json_response(
+            "/microservices", {"address": "localhost", "port": "5568", "status": True},
+        )
+
+        self.microservice = MockServer(host="localhost", port=5568)
+        self.microservice.add_json_response("/autz-anonymous/5", "Microservice call correct!!!")
+
+        self.validate_token_calls = 0
+
+        def _validate_token_callback():
+            self.validate_token_calls += 1
+            return jsonify({"uuid": uuid4(), "role": 3})
+
+        self.authentication_service = MockServer(host=self.config.rest.auth.host, port=self.config.rest.auth.port)
+        self.authentication_service.add_callback_response(
+            "/auth/validate-token", _validate_token_callback, methods=("POST",)
+        )
+
+        self.discovery.start()
+        self.microservice.start()
+        self.authentication_service.start()
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.discovery.shutdown_server()
+        self.microservice.shutdown_server()
+        self.authentication_service.shutdown_server()
+        super().tearDown()
+
+    async def get_application(self):
+        """
+        Override the get_app method to return your application.
+        """
+        rest_service = ApiGatewayRestService(
+            address=self.config.rest.host, port=self.config.rest.port, config=self.config
+        )
+
+        return await rest_service.create_application()
+
+    @unittest_run_loop
+    async def test_anonymous_protected(self):
+        await self.client.post(
+            "/admin/autz-rules",
+            data=json.dumps(
+                {"service": "autz-anonymous", "roles": [3], "rule": "*://*/autz-anonymous/*", "methods": ["GET"]}
+            ),
+        )
+        url = "/autz-anonymous/5"
+
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(401, response.status)
+        self.assertIn("The given request does not have authorization to be forwarded", await response.text())
+        self.assertEqual(0, self.validate_token_calls)
+
+
 class TestAutzFailed(AioHTTPTestCase):
     CONFIG_FILE_PATH = BASE_PATH / "config.yml"
 
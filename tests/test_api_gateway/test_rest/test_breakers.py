@@ -0,0 +1,50 @@
+"""tests.test_api_gateway.test_rest.breakers module."""
+
+import unittest
+from unittest.mock import (
+    patch,
+)
+
+from minos.api_gateway.rest.breakers import (
+    CircuitBreaker,
+)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_closed(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        self.assertFalse(breaker.is_open)
+
+    def test_open(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        for _ in range(3):
+            breaker.record_failure()
+
+        self.assertTrue(breaker.is_open)
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        self.assertFalse(breaker.is_open)
+
+    def test_reset_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+        with patch("minos.api_gateway.rest.breakers.monotonic", return_value=100.0):
+            breaker.record_failure()
+            self.assertTrue(breaker.is_open)
+
+        with patch("minos.api_gateway.rest.breakers.monotonic", return_value=110.0):
+            self.assertFalse(breaker.is_open)
+            breaker.record_failure()
+            self.assertTrue(breaker.is_open)
+
+
+if __name__ == "__main__":
+    unittest.main()
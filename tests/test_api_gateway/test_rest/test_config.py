@@ -67,6 +67,7 @@ class TestApiGatewayConfig(unittest.TestCase):
 
         self.assertEqual("localhost", discovery.host)
         self.assertEqual(5567, discovery.port)
+        self.assertEqual(30.0, discovery.cache_ttl)
 
     @mock.patch.dict(os.environ, {"API_GATEWAY_DISCOVERY_HOST": "::1"})
     def test_overwrite_with_environment_discovery_host(self):
@@ -78,6 +79,11 @@ class TestApiGatewayConfig(unittest.TestCase):
         config = ApiGatewayConfig(path=self.config_file_path)
         self.assertEqual(4040, config.discovery.port)
 
+    @mock.patch.dict(os.environ, {"API_GATEWAY_DISCOVERY_CACHE_TTL": "0"})
+    def test_overwrite_with_environment_discovery_cache_ttl(self):
+        config = ApiGatewayConfig(path=self.config_file_path)
+        self.assertEqual(0.0, config.discovery.cache_ttl)
+
     @mock.patch.dict(os.environ, {"API_GATEWAY_REST_HOST": "::1"})
     def test_overwrite_with_environment(self):
         config = ApiGatewayConfig(path=self.config_file_path)
@@ -0,0 +1,210 @@
+"""tests.test_api_gateway.test_rest.handler module."""
+
+import asyncio
+import unittest
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    call,
+    patch,
+)
+
+from aiohttp import (
+    ClientConnectorError,
+    ServerDisconnectedError,
+    StreamReader,
+    web,
+)
+
+from minos.api_gateway.rest.breakers import (
+    CircuitBreaker,
+)
+from minos.api_gateway.rest.exceptions import (
+    CircuitOpenException,
+    UnavailableServiceException,
+)
+from minos.api_gateway.rest.handler import (
+    DISCOVERY_RECORD,
+    _call_with_retry,
+    _resolve,
+    _single_flight,
+)
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.inflight = dict()
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def _fn(self, value):
+        self.calls += 1
+        await self.release.wait()
+        return value
+
+    async def _fail(self):
+        self.calls += 1
+        await self.release.wait()
+        raise web.HTTPUnauthorized(text="Unauthorized")
+
+    async def test_coalesce(self):
+        first = asyncio.create_task(_single_flight(self.inflight, "key", self._fn, 1))
+        second = asyncio.create_task(_single_flight(self.inflight, "key", self._fn, 2))
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertEqual([1, 1], await asyncio.gather(first, second))
+        self.assertEqual(1, self.calls)
+        await asyncio.sleep(0)
+        self.assertEqual(dict(), self.inflight)
+
+    async def test_different_keys(self):
+        self.release.set()
+        results = await asyncio.gather(
+            _single_flight(self.inflight, "one", self._fn, 1), _single_flight(self.inflight, "two", self._fn, 2),
+        )
+
+        self.assertEqual([1, 2], results)
+        self.assertEqual(2, self.calls)
+
+    async def test_exception(self):
+        first = asyncio.create_task(_single_flight(self.inflight, "key", self._fail))
+        second = asyncio.create_task(_single_flight(self.inflight, "key", self._fail))
+        await asyncio.sleep(0)
+        self.release.set()
+
+        first_exc, second_exc = await asyncio.gather(first, second, return_exceptions=True)
+
+        self.assertIsInstance(first_exc, web.HTTPUnauthorized)
+        self.assertIsInstance(second_exc, web.HTTPUnauthorized)
+        self.assertIsNot(first_exc, second_exc)
+        self.assertEqual(1, self.calls)
+
+    async def test_leader_cancelled(self):
+        leader = asyncio.create_task(_single_flight(self.inflight, "key", self._fn, 1))
+        follower = asyncio.create_task(_single_flight(self.inflight, "key", self._fn, 2))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertEqual(1, await follower)
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(1, self.calls)
+
+
+class TestResolve(unittest.IsolatedAsyncioTestCase):
+    async def test_resolve(self):
+        record = DISCOVERY_RECORD("localhost", 5568)
+        with patch("minos.api_gateway.rest.handler.discover", return_value=record), patch(
+            "minos.api_gateway.rest.handler.get_user", return_value="user"
+        ):
+            self.assertEqual((record, "user"), await _resolve(MagicMock(), "GET", "/order"))
+
+    async def test_unauthorized_cancels_discovery(self):
+        discovery_cancelled = asyncio.Event()
+
+        async def _discover(*args):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                discovery_cancelled.set()
+                raise
+
+        async def _get_user(*args):
+            raise web.HTTPUnauthorized()
+
+        with patch("minos.api_gateway.rest.handler.discover", _discover), patch(
+            "minos.api_gateway.rest.handler.get_user", _get_user
+        ):
+            with self.assertRaises(web.HTTPUnauthorized):
+                await asyncio.wait_for(_resolve(MagicMock(), "GET", "/order"), 1)
+
+        await asyncio.wait_for(discovery_cancelled.wait(), 1)
+
+
+class TestCallWithRetry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.breaker = CircuitBreaker(failure_threshold=2)
+        self.response = MagicMock()
+        self.session = MagicMock()
+        self.session.request = AsyncMock()
+
+    @staticmethod
+    def _connector_error() -> ClientConnectorError:
+        return ClientConnectorError(MagicMock(), OSError("Connection refused"))
+
+    async def test_call(self):
+        self.session.request.return_value = self.response
+
+        response = await _call_with_retry(self.session, "GET", "/order", breaker=self.breaker, headers={"a": "b"})
+
+        self.assertEqual(self.response, response)
+        self.assertEqual([call("GET", "/order", headers={"a": "b"})], self.session.request.call_args_list)
+
+    async def test_retry(self):
+        self.session.request.side_effect = [self._connector_error(), ServerDisconnectedError(), self.response]
+
+        with patch("minos.api_gateway.rest.handler.asyncio.sleep") as sleep, patch(
+            "minos.api_gateway.rest.handler.random.uniform", return_value=0.0
+        ):
+            response = await _call_with_retry(self.session, "GET", "/order", breaker=self.breaker, base_delay=0.1)
+
+        self.assertEqual(self.response, response)
+        self.assertEqual(3, self.session.request.call_count)
+        self.assertEqual([call(0.1), call(0.2)], sleep.call_args_list)
+        self.assertFalse(self.breaker.is_open)
+
+    async def test_retries_exhausted(self):
+        self.session.request.side_effect = self._connector_error()
+
+        with patch("minos.api_gateway.rest.handler.asyncio.sleep"):
+            for _ in range(2):
+                with self.assertRaises(UnavailableServiceException):
+                    await _call_with_retry(self.session, "GET", "/order", breaker=self.breaker, retries=2)
+
+        self.assertEqual(6, self.session.request.call_count)
+        self.assertTrue(self.breaker.is_open)
+
+    async def test_circuit_open(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        with self.assertRaises(CircuitOpenException):
+            await _call_with_retry(self.session, "GET", "/order", breaker=self.breaker)
+
+        self.assertEqual(0, self.session.request.call_count)
+
+    async def test_disconnected_not_idempotent(self):
+        self.session.request.side_effect = [ServerDisconnectedError(), self.response]
+
+        with patch("minos.api_gateway.rest.handler.asyncio.sleep"):
+            with self.assertRaises(UnavailableServiceException):
+                await _call_with_retry(self.session, "POST", "/order", breaker=self.breaker, data=b"{}")
+
+        self.assertEqual(1, self.session.request.call_count)
+
+    async def test_disconnected_streamed_body(self):
+        self.session.request.side_effect = [ServerDisconnectedError(), self.response]
+        data = MagicMock(spec=StreamReader)
+
+        with patch("minos.api_gateway.rest.handler.asyncio.sleep"):
+            with self.assertRaises(UnavailableServiceException):
+                await _call_with_retry(self.session, "PUT", "/order", breaker=self.breaker, data=data)
+
+        self.assertEqual(1, self.session.request.call_count)
+
+    async def test_connector_error_streamed_body(self):
+        self.session.request.side_effect = [self._connector_error(), self.response]
+        data = MagicMock(spec=StreamReader)
+
+        with patch("minos.api_gateway.rest.handler.asyncio.sleep"):
+            response = await _call_with_retry(self.session, "POST", "/order", breaker=self.breaker, data=data)
+
+        self.assertEqual(self.response, response)
+        self.assertEqual(2, self.session.request.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
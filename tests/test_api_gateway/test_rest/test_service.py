@@ -1,12 +1,26 @@
 """tests.test_api_gateway.test_rest.service module."""
 
+import base64
+import gzip
+import json
 import os
 import unittest
+from unittest.mock import (
+    patch,
+)
 
+from aiohttp import (
+    ClientPayloadError,
+)
 from aiohttp.test_utils import (
     AioHTTPTestCase,
     unittest_run_loop,
 )
+from flask import (
+    Response,
+    jsonify,
+    request,
+)
 from werkzeug.exceptions import (
     abort,
 )
@@ -15,6 +29,9 @@ from minos.api_gateway.rest import (
     ApiGatewayConfig,
     ApiGatewayRestService,
 )
+from minos.api_gateway.rest.handler import (
+    BATCH_ITEM_MAX_BODY_SIZE,
+)
 from tests.mock_servers.server import (
     MockServer,
 )
@@ -40,6 +57,37 @@ class TestApiGatewayRestService(AioHTTPTestCase):
             "/order/5", "Microservice call correct!!!", methods=("GET", "PUT", "PATCH", "DELETE",)
         )
         self.microservice.add_json_response("/order", "Microservice call correct!!!", methods=("POST",))
+        self.microservice.add_callback_response(
+            "/image", lambda: Response(b"\x89PNG\xff\x00", mimetype="image/png"), methods=("GET",)
+        )
+        self.microservice.add_callback_response(
+            "/compressed",
+            lambda: Response(gzip.compress(b"Microservice call correct!!!"), headers={"Content-Encoding": "gzip"}),
+            methods=("GET",),
+        )
+        self.microservice.add_callback_response("/headers", lambda: jsonify(dict(request.headers)), methods=("GET",))
+        self.microservice.add_callback_response(
+            "/hop-by-hop",
+            lambda: Response(
+                "Microservice call correct!!!",
+                headers={"Connection": "X-Bar", "X-Bar": "1", "Proxy-Authenticate": "Basic", "X-Baz": "2"},
+            ),
+            methods=("GET",),
+        )
+        self.microservice.add_callback_response(
+            "/raw/<path:path>", lambda path: request.environ["RAW_URI"], methods=("GET",)
+        )
+        self.microservice.add_callback_response(
+            "/large", lambda: Response(b"x" * (BATCH_ITEM_MAX_BODY_SIZE + 1)), methods=("GET",)
+        )
+        self.microservice.add_callback_response(
+            "/large-stream", lambda: Response(iter([b"x" * BATCH_ITEM_MAX_BODY_SIZE, b"x"])), methods=("GET",)
+        )
+        self.microservice.add_callback_response("/upload", lambda: Response(request.get_data()), methods=("POST",))
+        self.microservice.add_callback_response("/not-modified", lambda: Response(status=304), methods=("GET",))
+        self.microservice.add_callback_response(
+            "/stream", lambda: Response(iter([b"Microservice ", b"call correct!!!"])), methods=("GET", "HEAD")
+        )
 
         self.discovery.start()
         self.microservice.start()
@@ -99,6 +147,315 @@ class TestApiGatewayRestService(AioHTTPTestCase):
         self.assertEqual(200, response.status)
         self.assertIn("Microservice call correct!!!", await response.text())
 
+    @unittest_run_loop
+    async def test_get_compressed(self):
+        url = "/compressed"
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(200, response.status)
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual(len(gzip.compress(b"Microservice call correct!!!")), int(response.headers["Content-Length"]))
+        self.assertEqual("Microservice call correct!!!", await response.text())
+
+    @unittest_run_loop
+    async def test_request_hop_by_hop_headers(self):
+        url = "/headers"
+        headers = {
+            "Connection": "close, X-Foo",
+            "X-Foo": "1",
+            "Proxy-Authorization": "Basic dGVzdA==",
+            "X-User": "forged",
+            "X-Baz": "2",
+        }
+        response = await self.client.request("GET", url, headers=headers)
+
+        self.assertEqual(200, response.status)
+        observed = await response.json()
+        for name in ("X-Foo", "Proxy-Authorization", "X-User"):
+            self.assertNotIn(name, observed)
+        self.assertEqual("2", observed["X-Baz"])
+
+    @unittest_run_loop
+    async def test_response_hop_by_hop_headers(self):
+        url = "/hop-by-hop"
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(200, response.status)
+        self.assertEqual("Microservice call correct!!!", await response.text())
+        self.assertNotIn("X-Bar", response.headers)
+        self.assertNotIn("Proxy-Authenticate", response.headers)
+        self.assertEqual("2", response.headers["X-Baz"])
+
+    @unittest_run_loop
+    async def test_get_raw_url(self):
+        url = "/raw/a%2Fb?x=a%20b"
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(200, response.status)
+        self.assertEqual(url, await response.text())
+
+    @unittest_run_loop
+    async def test_post_binary(self):
+        url = "/upload"
+        data = bytes(range(256)) * 64
+        response = await self.client.request("POST", url, data=data)
+
+        self.assertEqual(200, response.status)
+        self.assertEqual(data, await response.read())
+
+    @unittest_run_loop
+    async def test_get_not_modified(self):
+        url = "/not-modified"
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(304, response.status)
+        self.assertNotIn("Transfer-Encoding", response.headers)
+
+    @unittest_run_loop
+    async def test_head(self):
+        url = "/stream"
+        response = await self.client.request("HEAD", url)
+
+        self.assertEqual(200, response.status)
+        self.assertNotIn("Transfer-Encoding", response.headers)
+
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(200, response.status)
+        self.assertEqual("Microservice call correct!!!", await response.text())
+
+    @unittest_run_loop
+    async def test_batch(self):
+        url = "/gateway/batch"
+        data = json.dumps([{"method": "GET", "path": "/order/5"}, {"method": "POST", "path": "/order", "body": {}}])
+        response = await self.client.request("POST", url, data=data)
+
+        self.assertEqual(200, response.status)
+        results = await response.json()
+        self.assertEqual([200, 200], [result["status"] for result in results])
+        for result in results:
+            self.assertIn("Microservice call correct!!!", result["body"])
+
+    @unittest_run_loop
+    async def test_batch_binary(self):
+        url = "/gateway/batch"
+        data = json.dumps([{"method": "GET", "path": "/image", "headers": {"Accept-Encoding": "gzip"}}])
+        response = await self.client.request("POST", url, data=data)
+
+        self.assertEqual(200, response.status)
+        [result] = await response.json()
+        self.assertEqual(200, result["status"])
+        self.assertEqual("base64", result["encoding"])
+        self.assertEqual(b"\x89PNG\xff\x00", base64.b64decode(result["body"]))
+
+    @unittest_run_loop
+    async def test_batch_payload_error(self):
+        url = "/gateway/batch"
+        data = json.dumps([{"method": "GET", "path": "/order/5"}])
+        with patch("minos.api_gateway.rest.handler._forward_batch_item", side_effect=ClientPayloadError()):
+            response = await self.client.request("POST", url, data=data)
+
+        self.assertEqual(200, response.status)
+        [result] = await response.json()
+        self.assertEqual(502, result["status"])
+        self.assertEqual("The requested endpoint response is wrong.", result["body"])
+
+    @unittest_run_loop
+    async def test_batch_response_too_large(self):
+        url = "/gateway/batch"
+        data = json.dumps([{"method": "GET", "path": "/large"}, {"method": "GET", "path": "/large-stream"}])
+        response = await self.client.request("POST", url, data=data)
+
+        self.assertEqual(200, response.status)
+        results = await response.json()
+        self.assertEqual([502, 502], [result["status"] for result in results])
+        for result in results:
+            self.assertEqual("The requested endpoint response is too large.", result["body"])
+
+    @unittest_run_loop
+    async def test_batch_too_large(self):
+        url = "/gateway/batch"
+        data = json.dumps([{"method": "GET", "path": "/order/5"}] * 101)
+        response = await self.client.request("POST", url, data=data)
+
+        self.assertEqual(400, response.status)
+        self.assertIn("The batch cannot contain more than 100 calls.", await response.text())
+
+
+class TestApiGatewayRestServiceDiscoveryCache(AioHTTPTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "config.yml"
+
+    def setUp(self) -> None:
+        os.environ["API_GATEWAY_REST_AUTH_ENABLED"] = "false"
+        self.config = ApiGatewayConfig(self.CONFIG_FILE_PATH)
+
+        self.discovery_calls = 0
+        self.discovery_ports = list()
+
+        def _discovery_callback():
+            self.discovery_calls += 1
+            port = self.discovery_ports.pop(0) if self.discovery_ports else "5568"
+            return jsonify({"address": "localhost", "port": port, "status": True})
+
+        self.discovery = MockServer(host=self.config.discovery.host, port=self.config.discovery.port,)
+        self.discovery.add_callback_response("/microservices", _discovery_callback, methods=("GET",))
+
+        self.microservice = MockServer(host="localhost", port=5568)
+        self.microservice.add_json_response("/order/5", "Microservice call correct!!!", methods=("GET",))
+
+        self.discovery.start()
+        self.microservice.start()
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.discovery.shutdown_server()
+        self.microservice.shutdown_server()
+        super().tearDown()
+
+    async def get_application(self):
+        """
+        Override the get_app method to return your application.
+        """
+        rest_service = ApiGatewayRestService(
+            address=self.config.rest.host, port=self.config.rest.port, config=self.config
+        )
+
+        return await rest_service.create_application()
+
+    @unittest_run_loop
+    async def test_get_cached(self):
+        url = "/order/5"
+        for _ in range(3):
+            response = await self.client.request("GET", url)
+            self.assertEqual(200, response.status)
+            self.assertIn("Microservice call correct!!!", await response.text())
+
+        self.assertEqual(1, self.discovery_calls)
+
+    @unittest_run_loop
+    async def test_get_moved(self):
+        url = "/order/5"
+        self.discovery_ports.append("5569")
+
+        response = await self.client.request("GET", url)
+        self.assertEqual(503, response.status)
+
+        response = await self.client.request("GET", url)
+        self.assertEqual(200, response.status)
+        self.assertIn("Microservice call correct!!!", await response.text())
+
+        self.assertEqual(2, self.discovery_calls)
+
+
+class TestApiGatewayRestServiceResponseCache(AioHTTPTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "config.yml"
+
+    def setUp(self) -> None:
+        os.environ["API_GATEWAY_REST_AUTH_ENABLED"] = "false"
+        self.config = ApiGatewayConfig(self.CONFIG_FILE_PATH)
+
+        self.discovery = MockServer(host=self.config.discovery.host, port=self.config.discovery.port,)
+        self.discovery.add_json_response(
+            "/microservices", {"address": "localhost", "port": "5568", "status": True},
+        )
+
+        self.microservice_calls = 0
+        self.order = "Microservice call correct!!!"
+
+        def _public_callback():
+            self.microservice_calls += 1
+            response = jsonify(self.order)
+            response.headers["Cache-Control"] = "public, max-age=60"
+            return response
+
+        def _update_callback():
+            self.order = request.get_data(as_text=True)
+            return jsonify(self.order)
+
+        def _create_callback():
+            self.order = request.get_data(as_text=True)
+            response = jsonify(self.order)
+            response.status_code = 201
+            response.headers["Location"] = "/order/5"
+            return response
+
+        def _private_callback():
+            self.microservice_calls += 1
+            response = jsonify("Microservice call correct!!!")
+            response.headers["Cache-Control"] = "private, max-age=60"
+            return response
+
+        self.microservice = MockServer(host="localhost", port=5568)
+        self.microservice.add_callback_response("/order/5", _public_callback, methods=("GET",))
+        self.microservice.add_callback_response("/order/5", _update_callback, methods=("PUT",))
+        self.microservice.add_callback_response("/order", _create_callback, methods=("POST",))
+        self.microservice.add_callback_response("/order/6", _private_callback, methods=("GET",))
+
+        self.discovery.start()
+        self.microservice.start()
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.discovery.shutdown_server()
+        self.microservice.shutdown_server()
+        super().tearDown()
+
+    async def get_application(self):
+        """
+        Override the get_app method to return your application.
+        """
+        rest_service = ApiGatewayRestService(
+            address=self.config.rest.host, port=self.config.rest.port, config=self.config
+        )
+
+        return await rest_service.create_application()
+
+    @unittest_run_loop
+    async def test_get_public(self):
+        url = "/order/5"
+        for _ in range(3):
+            response = await self.client.request("GET", url)
+            self.assertEqual(200, response.status)
+            self.assertIn("Microservice call correct!!!", await response.text())
+
+        self.assertEqual(1, self.microservice_calls)
+
+    @unittest_run_loop
+    async def test_get_private(self):
+        url = "/order/6"
+        for _ in range(3):
+            response = await self.client.request("GET", url)
+            self.assertEqual(200, response.status)
+            self.assertIn("Microservice call correct!!!", await response.text())
+
+        self.assertEqual(3, self.microservice_calls)
+
+    @unittest_run_loop
+    async def test_put_invalidates(self):
+        url = "/order/5"
+        response = await self.client.request("GET", url)
+        self.assertIn("Microservice call correct!!!", await response.text())
+
+        response = await self.client.request("PUT", url, data="Updated order")
+        self.assertEqual(200, response.status)
+
+        response = await self.client.request("GET", url)
+        self.assertIn("Updated order", await response.text())
+        self.assertEqual(2, self.microservice_calls)
+
+    @unittest_run_loop
+    async def test_post_invalidates_location(self):
+        url = "/order/5"
+        response = await self.client.request("GET", url)
+        self.assertIn("Microservice call correct!!!", await response.text())
+
+        response = await self.client.request("POST", "/order", data="Created order")
+        self.assertEqual(201, response.status)
+
+        response = await self.client.request("GET", url)
+        self.assertIn("Created order", await response.text())
+        self.assertEqual(2, self.microservice_calls)
+
 
 class TestApiGatewayRestServiceNotFoundDiscovery(AioHTTPTestCase):
     CONFIG_FILE_PATH = BASE_PATH / "config.yml"
@@ -195,6 +552,20 @@ class TestApiGatewayRestServiceUnreachableDiscovery(AioHTTPTestCase):
         self.assertEqual(504, response.status)
         self.assertIn("The Discovery Service is not available.", await response.text())
 
+    @unittest_run_loop
+    async def test_get_circuit_open(self):
+        url = "/order/5?verb=GET&path=12324"
+        breaker = self.app["breakers"]["discovery"]
+
+        for _ in range(breaker.failure_threshold):
+            await self.client.request("GET", url)
+        self.assertTrue(breaker.is_open)
+
+        response = await self.client.request("GET", url)
+
+        self.assertEqual(503, response.status)
+        self.assertIn("The Discovery Service is not available.", await response.text())
+
 
 class TestApiGatewayRestServiceUnreachableMicroservice(AioHTTPTestCase):
     CONFIG_FILE_PATH = BASE_PATH / "config.yml"